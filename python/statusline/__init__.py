@@ -99,30 +99,21 @@ def merge_cli_options(
     config: Config,
     modules: str | None,
     separator: str | None,
-    theme: str | None,
     color: bool,
     width: int | None = None,
 ) -> Config:
-    """Merge CLI options into config, with CLI taking precedence."""
-    new_theme = theme if theme else config.theme
-    new_modules = config.modules
-
-    # If theme changed, update modules with new theme
-    if new_theme != config.theme:
-        # Assignment triggers model_validator to apply new theme's overrides
-        new_modules = {}
-        for name, module_config in config.modules.items():
-            new_cfg = module_config.model_copy()
-            new_cfg.theme = new_theme
-            new_modules[name] = new_cfg
+    """Merge CLI options into config, with CLI taking precedence.
 
+    The --theme option is applied earlier, by load_config, so every module is
+    built from its TOML with that theme's overrides.
+    """
     return Config(
-        theme=new_theme,
+        theme=config.theme,
         color=color,
         enabled=parse_modules(modules) if modules else config.enabled,
         separator=separator if separator is not None else config.separator,
         width=width if width is not None else config.width,
-        modules=new_modules,
+        modules=config.modules,
     )
 
 
@@ -170,8 +161,8 @@ def render(
     ] = True,
 ) -> None:
     """Render the status line (reads JSON from stdin)."""
-    config = load_config(ctx.obj.config_path)
-    config = merge_cli_options(config, modules, separator, theme, color, width)
+    config = load_config(ctx.obj.config_path, theme=theme)
+    config = merge_cli_options(config, modules, separator, color, width)
     if ctx.command.name == "render":
         if sys.stdin.isatty():
             report_error(
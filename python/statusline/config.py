@@ -15,7 +15,13 @@ CONFIG_PATH = Path.home() / ".claude" / "statusline.toml"
 
 
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    """Deep merge two dictionaries, with override taking precedence."""
+    """Deep merge two dictionaries, with override taking precedence.
+
+    Only dicts on the override path are copied; everything else is shared
+    with *base*, which is returned as-is when there is nothing to merge.
+    """
+    if not override:
+        return base
     result = base.copy()
     for key, value in override.items():
         if key in result and isinstance(result[key], dict) and isinstance(value, dict):
@@ -355,18 +361,70 @@ def _load_user_config(path: Path | None = None) -> dict[str, Any]:
         report_error(f"parsing config file '{config_path}'", exc)
 
 
-def load_config(path: Path | None = None) -> Config:
+def _freeze(value: Any) -> Any:
+    """Build a hashable key for a TOML value, keeping scalar types distinct."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(val)) for key, val in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(val) for val in value)
+    return (type(value), value)
+
+
+def _intern_theme_vars(modules: dict[str, Any]) -> None:
+    """Share a single dict between identical per-theme overrides.
+
+    Many modules carry the same override body (e.g. ``{label = ""}`` for the
+    minimal theme). Theme overrides are only read after loading, so equal
+    bodies can point at one dict instead of one copy per module.
+    """
+    table: dict[Any, dict[str, Any]] = {}
+    for module_data in modules.values():
+        if not isinstance(module_data, dict):
+            continue
+        themes = module_data.get("themes")
+        if not isinstance(themes, dict):
+            continue
+        for theme_name, theme_vars in themes.items():
+            if isinstance(theme_vars, dict):
+                themes[theme_name] = table.setdefault(_freeze(theme_vars), theme_vars)
+
+
+def load_config(path: Path | None = None, theme: str | None = None) -> Config:
     """Load configuration, merging defaults with user config.
 
     Args:
         path: Path to user config file. Defaults to ~/.claude/statusline.toml
+        theme: Theme to use instead of the configured one (e.g. from --theme).
+            Applies to every module, including ones that set their own theme.
 
     Returns:
         Merged Config with user values overriding defaults.
     """
+    return _build_config(_load_user_config(path), theme)
+
+
+def load_config_from_string(text: str) -> Config:
+    """Load configuration from user config TOML text, merged over defaults.
+
+    Args:
+        text: Contents of a user config file.
+
+    Returns:
+        Merged Config with user values overriding defaults.
+    """
+    try:
+        user = tomllib.loads(text)
+    except Exception as exc:
+        report_error("parsing config", exc)
+    return _build_config(user)
+
+
+def _build_config(user: dict[str, Any], theme: str | None = None) -> Config:
+    """Merge parsed user config over the bundled defaults."""
     defaults = _load_defaults()
-    user = _load_user_config(path)
     merged = _deep_merge(defaults, user)
+    if theme:
+        merged["theme"] = theme
 
     # Inject global theme into each module for theme resolution
     # Also handle aliases: if module has type different from key, inherit from base type
@@ -377,8 +435,8 @@ def load_config(path: Path | None = None) -> Config:
         if not isinstance(module_data, dict):
             continue
 
-        # Inject global theme if not set
-        if "theme" not in module_data:
+        # Inject global theme if not set (an explicit theme overrides all)
+        if theme or "theme" not in module_data:
             module_data["theme"] = global_theme
 
         # Handle aliases: inherit from base type's config
@@ -389,12 +447,11 @@ def load_config(path: Path | None = None) -> Config:
                 # Deep-merge: base first, then alias overrides
                 modules[alias] = _deep_merge(base_config, module_data)
 
+    _intern_theme_vars(modules)
     return _parse_config(merged)
 
 
-def generate_default_config_toml() -> str:
-    """Generate default config file content for users to customize."""
-    return """\
+_DEFAULT_CONFIG_TOML = """\
 # Statusline configuration
 # Location: ~/.claude/statusline.toml
 
@@ -434,3 +491,8 @@ def generate_default_config_toml() -> str:
 # [modules.model.themes.custom]  # Create your own theme
 # label = "MODEL:"
 """
+
+
+def generate_default_config_toml() -> str:
+    """Generate default config file content for users to customize."""
+    return _DEFAULT_CONFIG_TOML
@@ -2,42 +2,205 @@
 
 from __future__ import annotations
 
+import re
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple, Protocol, overload
 
-from pydantic import BaseModel
-from rich.text import Text
+from rich.text import Span, Text
 
 from statusline.config import EventsBackgrounds, EventsLineBars
 
 
-class EventData(BaseModel):
-    """Pure data for an event."""
-
+# Hook event and tool names that recur in every session. Kept in step with
+# the default icon maps and create_event's dispatch by a test.
+_KNOWN_NAMES = frozenset(
+    {
+        "PostToolUse",
+        "PostToolUseFailure",
+        "UserPromptSubmit",
+        "Stop",
+        "StopUndone",
+        "SubagentStart",
+        "SubagentStop",
+        "Interrupt",
+        "Bash",
+        "Edit",
+        "Write",
+        "Read",
+        "Glob",
+        "Grep",
+        "Task",
+        "TaskCreate",
+        "TaskUpdate",
+        "TaskList",
+        "TaskGet",
+        "WebFetch",
+        "WebSearch",
+    }
+)
+
+
+class _EventFields(NamedTuple):
     event: str  # Original event name (e.g., "PostToolUse", "Stop")
     tool: str | None = None
     agent_id: str | None = None
     extra: str | None = None
     effective_event: str = ""  # "StopUndone", "Interrupt", or same as event
 
-    def model_post_init(self, __context) -> None:
-        if not self.effective_event:
-            self.effective_event = self.event
 
+class EventData(_EventFields):
+    """Pure data for an event.
+
+    An immutable tuple: one is built per logged event, so construction and
+    field reads are kept as cheap as possible.
+    """
 
-@dataclass
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        event: str,
+        tool: str | None = None,
+        agent_id: str | None = None,
+        extra: str | None = None,
+        effective_event: str = "",
+    ) -> EventData:
+        # Names read from the event log are fresh strings; interning the
+        # known ones lets icon lookups match keys by identity.
+        if event in _KNOWN_NAMES:
+            event = sys.intern(event)
+        if tool in _KNOWN_NAMES:
+            tool = sys.intern(tool)
+        if effective_event in _KNOWN_NAMES:
+            effective_event = sys.intern(effective_event)
+        # effective_event defaults to the original event name
+        return super().__new__(
+            cls, event, tool, agent_id, extra, effective_event or event
+        )
+
+
+# Line counts below _MIN_BAR_LUT always come from EventStyle.bar_lut; the
+# table never grows past _MAX_BAR_LUT, larger counts fall back to bisect.
+_MIN_BAR_LUT = 64
+_MAX_BAR_LUT = 256
+
+# Event names that carry a tool use (tool events may also have no event name)
+_TOOL_USE_EVENTS = frozenset({"PostToolUse", ""})
+
+
+class _IconLookup(Protocol):
+    """Signature of EventStyle.icon (icon_map.get)."""
+
+    @overload
+    def __call__(self, key: tuple[str, str], /) -> str | None: ...
+    @overload
+    def __call__(self, key: tuple[str, str], default: str, /) -> str: ...
+
+
+@dataclass(slots=True, frozen=True)
 class EventStyle:
     """Styling options for event rendering.
 
     Note: Run-level backgrounds are applied in events.py via Styled(),
     not here. This keeps event renderables pure and composable.
+
+    Lookup tables are derived once in __post_init__; the style is frozen
+    so they can't drift from the icon dicts they were built from.
     """
 
-    tool_icons: dict[str, str]
-    event_icons: dict[str, str]
-    bash_icons: dict[str, str]
+    tool_icons: Mapping[str, str]
+    event_icons: Mapping[str, str]
+    bash_icons: Mapping[str, str]
     backgrounds: EventsBackgrounds
     line_bars: EventsLineBars
+    # Derived fields below are excluded from comparison: equality is decided
+    # by the inputs above, not by the objects built from them.
+    icon_map: dict[tuple[str, str], str] = field(init=False, repr=False, compare=False)
+    """All icons in one table, keyed ("tool" | "event" | "bash", name)."""
+    icon: _IconLookup = field(init=False, repr=False, compare=False)
+    """Bound icon_map.get, saving an attribute hop per lookup."""
+    task_status_icons: dict[str, str] = field(init=False, repr=False, compare=False)
+    """TaskUpdate icon by status; statuses not listed use task_other_icon."""
+    task_other_icon: str = field(init=False, repr=False, compare=False)
+    bash_fallback_icon: str = field(init=False, repr=False, compare=False)
+    """Bash icon for commands without a bash_icons entry."""
+    bar_lut: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    """Bar character by line count, for small counts (see _bar_lut)."""
+
+    def __post_init__(self) -> None:
+        set_field = object.__setattr__  # frozen dataclass
+
+        # Read-only views: styles share the config's icon dicts, never copy them
+        for name in ("tool_icons", "event_icons", "bash_icons"):
+            icons = getattr(self, name)
+            if not isinstance(icons, MappingProxyType):
+                set_field(self, name, MappingProxyType(icons))
+
+        # Interned names match EventData's interned names by identity
+        intern = sys.intern
+        icon_map = {("tool", intern(k)): v for k, v in self.tool_icons.items()}
+        icon_map.update(
+            {("event", intern(k)): v for k, v in self.event_icons.items()}
+        )
+        icon_map.update({("bash", intern(k)): v for k, v in self.bash_icons.items()})
+        set_field(self, "icon_map", icon_map)
+        set_field(self, "icon", icon_map.get)
+
+        task_icon = self.tool_icons.get("TaskUpdate", "•")
+        set_field(
+            self,
+            "task_status_icons",
+            {"completed": self.tool_icons.get("TaskUpdate:completed", task_icon)},
+        )
+        set_field(
+            self, "task_other_icon", self.tool_icons.get("TaskUpdate:other", task_icon)
+        )
+        set_field(self, "bash_fallback_icon", self.tool_icons.get("Bash", "•"))
+
+        line_bars = self.line_bars
+        set_field(
+            self, "bar_lut", _bar_lut(line_bars.chars, tuple(line_bars.thresholds))
+        )
+
+    def line_bar(self, count: int) -> str:
+        """Get the bar character for a line count."""
+        bar_lut = self.bar_lut
+        if 0 <= count < len(bar_lut):
+            return bar_lut[count]
+        return _lines_to_bar(count, self.line_bars.chars, self.line_bars.thresholds)
+
+
+@lru_cache(maxsize=16)
+def _bar_lut(chars: str, thresholds: tuple[int, ...]) -> tuple[str, ...]:
+    """Bar character for each line count below the table size.
+
+    Covers counts up to the last threshold, capped at _MAX_BAR_LUT so user
+    thresholds can't blow up the table. Styles are rebuilt on every render,
+    so the table is built once per distinct line_bars setting.
+    """
+    size = min(max(max(thresholds, default=0) + 1, _MIN_BAR_LUT), _MAX_BAR_LUT)
+    threshold_list = list(thresholds)
+    return tuple(_lines_to_bar(n, chars, threshold_list) for n in range(size))
+
+
+@lru_cache(maxsize=256)
+def _parse_markup(markup: str) -> Text:
+    return Text.from_markup(markup)
+
+
+def icon_text(markup: str) -> Text:
+    """Get a Text for an icon's markup, parsing each distinct string once.
+
+    Icons come from a small fixed set, so the markup parse is cached and
+    callers get a copy they are free to append to.
+    """
+    return _parse_markup(markup).copy()
 
 
 class EventBase(ABC):
@@ -53,118 +216,165 @@ class EventBase(ABC):
         ...
 
 
+# TaskUpdate extra is "status=<status>"
+_STATUS_PREFIX = "status="
+_STATUS_PREFIX_LEN = len(_STATUS_PREFIX)
+
+
 class IconEvent(EventBase):
     """Generic icon-based event rendering."""
 
     def __rich__(self) -> Text:
-        return Text.from_markup(self._get_icon())
+        return icon_text(self._get_icon())
 
     def _get_icon(self) -> str:
         """Get the icon for this event."""
         data = self.data
-        style = self.style
+        icon = self.style.icon
 
         # Tool use events
-        if data.tool and (data.event == "PostToolUse" or not data.event):
+        if data.tool and data.event in _TOOL_USE_EVENTS:
             # TaskUpdate: different icons based on status
-            if data.tool == "TaskUpdate" and data.extra and data.extra.startswith("status="):
-                status = data.extra[7:]  # Remove "status=" prefix
-                if status == "completed":
-                    return style.tool_icons.get("TaskUpdate:completed", style.tool_icons.get(data.tool, "•"))
-                return style.tool_icons.get("TaskUpdate:other", style.tool_icons.get(data.tool, "•"))
-            return style.tool_icons.get(data.tool, "•")
+            extra = data.extra
+            if (
+                data.tool == "TaskUpdate"
+                and extra
+                and extra[:_STATUS_PREFIX_LEN] == _STATUS_PREFIX
+            ):
+                status = extra[_STATUS_PREFIX_LEN:]
+                style = self.style
+                return style.task_status_icons.get(status, style.task_other_icon)
+            return icon(("tool", data.tool), "•")
 
         # Non-tool events (Stop, UserPromptSubmit, etc.)
-        return style.event_icons.get(data.effective_event, "")
+        return icon(("event", data.effective_event), "")
 
 
 class BashEvent(EventBase):
     """Bash command event with command-specific icons."""
 
     def __rich__(self) -> Text:
-        icon = self._get_icon()
-        return Text.from_markup(icon)
+        return icon_text(self._get_icon())
 
     def _get_icon(self) -> str:
         """Get icon based on bash command."""
         extra = self.data.extra
-        if extra:
-            # Get first word and strip path prefix (e.g., /usr/bin/git -> git)
-            words = extra.split()
-            if words:
-                first_word = words[0]
-                cmd = first_word.split("/")[-1]
-                if cmd in self.style.bash_icons:
-                    return self.style.bash_icons[cmd]
-        # Fall back to generic Bash icon
-        return self.style.tool_icons.get("Bash", "•")
+        style = self.style
+        # None, blank and path-only commands ("///") have no command name
+        cmd = _bash_command(extra) if extra else ""
+        if cmd:
+            icon = style.icon(("bash", cmd))
+            if icon is not None:
+                return icon
+        return style.bash_fallback_icon
+
+
+@lru_cache(maxsize=256)
+def _bash_command(extra: str) -> str:
+    """Get the command name from a bash command line ("" if none).
+
+    Takes the first word and strips any path prefix (/usr/bin/git -> git).
+    Cached since the same commands recur throughout a session.
+    """
+    words = extra.split(maxsplit=1)
+    if not words:
+        return ""
+    return words[0].split("/")[-1]
+
+
+# "+N-M" line counts. Either number may be empty (0); otherwise each takes
+# exactly what int() accepts here: surrounding whitespace, an optional "+"
+# and digits with single underscores between them. Anything after a second
+# "-" is ignored.
+_LINE_COUNT = r"\s*\+?\d+(?:_\d+)*\s*"
+_LINE_COUNTS_RE = re.compile(
+    rf"\+({_LINE_COUNT})?(?:-({_LINE_COUNT})?(?:-.*)?)?", re.DOTALL
+)
 
 
 class EditEvent(EventBase):
     """Edit event with line change bars."""
 
     def __rich__(self) -> Text:
-        base_icon = self.style.tool_icons.get("Edit", "✏")
-        text = Text.from_markup(base_icon)
+        icon = _parse_markup(self.style.icon(("tool", "Edit"), "✏"))
 
         # Parse line counts from extra ("+N-M" format)
         added, removed = self._parse_line_counts()
-        if added is not None and removed is not None:
-            chars = self.style.line_bars.chars
-            thresholds = self.style.line_bars.thresholds
-            add_bar = _lines_to_bar(added, chars, thresholds)
-            rem_bar = _lines_to_bar(removed, chars, thresholds)
-            bar_bg = self.style.backgrounds.edit_bar
-            text.append(add_bar, style=f"green on {bar_bg}")
-            text.append(rem_bar, style=f"red on {bar_bg}")
-
-        return text
+        if added is None or removed is None:
+            return icon.copy()
+
+        # Build icon and both bars as one Text; each bar is one character
+        line_bar = self.style.line_bar
+        bar_bg = self.style.backgrounds.edit_bar
+        end = len(icon)
+        return Text(
+            icon.plain + line_bar(added) + line_bar(removed),
+            spans=[
+                *icon.spans,
+                Span(end, end + 1, f"green on {bar_bg}"),
+                Span(end + 1, end + 2, f"red on {bar_bg}"),
+            ],
+        )
 
     def _parse_line_counts(self) -> tuple[int | None, int | None]:
         """Parse '+N-M' format from extra field."""
         extra = self.data.extra
-        if not extra or not extra.startswith("+"):
+        if not extra:
             return None, None
-        try:
-            parts = extra[1:].split("-")
-            added = int(parts[0]) if parts[0] else 0
-            removed = int(parts[1]) if len(parts) > 1 and parts[1] else 0
-            return added, removed
-        except (ValueError, IndexError):
+        match = _LINE_COUNTS_RE.fullmatch(extra)
+        if match is None:
             return None, None
+        added, removed = match.groups()
+        return int(added) if added else 0, int(removed) if removed else 0
 
 
 class InterruptEvent(EventBase):
     """Interrupt event (PostToolUseFailure with interrupt flag)."""
 
     def __rich__(self) -> Text:
-        icon = self.style.event_icons.get("Interrupt", "")
-        return Text.from_markup(icon)
+        icon = self.style.icon(("event", "Interrupt"), "")
+        return icon_text(icon)
 
 
 def _lines_to_bar(count: int, chars: str, thresholds: list[int]) -> str:
     """Convert line count to a bar character (NBSP if 0)."""
     if count <= 0:
         return "\u00a0"  # Non-breaking space: invisible bar
-    for i, threshold in enumerate(thresholds):
-        if count < threshold:
-            return chars[i]
+    # Thresholds are sorted: index of the first one greater than count
+    i = bisect_right(thresholds, count)
+    if i < len(thresholds):
+        return chars[i]
     return chars[-1]
 
 
+# Tools with a dedicated renderable; all other tools use IconEvent
+_TOOL_EVENTS: dict[str, type[EventBase]] = {
+    "Bash": BashEvent,
+    "Edit": EditEvent,
+}
+
+
 def create_event(data: EventData, style: EventStyle) -> EventBase:
     """Factory function to create the appropriate event renderable."""
+    # Tool use events
+    if data.event in _TOOL_USE_EVENTS:
+        if data.tool:
+            return _TOOL_EVENTS.get(data.tool, IconEvent)(data, style)
+
     # Interrupt detection
-    if data.event == "PostToolUseFailure" and data.extra == "interrupt":
+    elif data.event == "PostToolUseFailure" and data.extra == "interrupt":
         return InterruptEvent(data, style)
 
-    # Tool use events
-    if data.tool and (data.event == "PostToolUse" or not data.event):
-        if data.tool == "Bash":
-            return BashEvent(data, style)
-        if data.tool == "Edit":
-            return EditEvent(data, style)
-        return IconEvent(data, style)
-
     # Non-tool events (Stop, UserPromptSubmit, etc.)
     return IconEvent(data, style)
+
+
+def render_many(events: Iterable[EventData], style: EventStyle, spacing: int = 0) -> Text:
+    """Render a sequence of events as a single Text.
+
+    Events are joined with ``spacing`` spaces in one pass rather than laid
+    out as one table column each.
+    """
+    return Text(" " * spacing).join(
+        [create_event(data, style).__rich__() for data in events]
+    )
@@ -9,12 +9,12 @@ from rich.styled import Styled
 from rich.table import Table
 from rich.text import Text
 
-from statusline.modules.events.event import EventData, EventStyle, create_event
+from statusline.modules.events.event import EventData, EventStyle, render_many
 
 RunContext = Literal["main", "user", "subagent"]
 
 
-@dataclass
+@dataclass(slots=True)
 class RunData:
     """Pure data for a run (contiguous sequence of events in same context)."""
 
@@ -23,7 +23,7 @@ class RunData:
     agent_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RunStyle:
     """Styling options for run rendering."""
 
@@ -43,19 +43,14 @@ class Run:
         self.style = style
 
     def __rich__(self) -> Table:
-        # Convert EventData to renderables
-        events = [create_event(ed, self.style.event_style) for ed in self.data.events]
-        if not events:
+        if not self.data.events:
             return Table.grid()
 
         style = self.style
         half_boundary = style.boundary_spacing // 2
 
-        # Inner grid: events with between-event spacing
-        inner = Table.grid(padding=(0, style.spacing, 0, 0))
-        for _ in events:
-            inner.add_column()
-        inner.add_row(*events)
+        # Inner content: events with between-event spacing
+        inner = render_many(self.data.events, style.event_style, style.spacing)
 
         # Apply background style
         styled_inner = Styled(inner, style=style.background) if style.background else inner
@@ -74,10 +69,13 @@ class Run:
         else:
             run_content = styled_inner
 
-        # Add brackets
-        open_text = Text.from_markup(style.open_bracket) if style.open_bracket else Text()
-        close_text = Text.from_markup(style.close_bracket) if style.close_bracket else Text()
+        # Add brackets (empty cells would still claim a column of width 1)
+        cells = [run_content]
+        if style.open_bracket:
+            cells.insert(0, Text.from_markup(style.open_bracket))
+        if style.close_bracket:
+            cells.append(Text.from_markup(style.close_bracket))
 
         bracketed = Table.grid()
-        bracketed.add_row(open_text, run_content, close_text)
+        bracketed.add_row(*cells)
         return bracketed
@@ -153,17 +153,18 @@ class EventsInfoProvider(InputProvider):
     input_type = EventsInfo
 
     def provide(self, input: StatuslineInput) -> EventsInfo:
-        # If events are provided directly in input, use them (for preview/testing)
+        # If events are provided directly in input, use them (for preview/testing).
+        # Otherwise input.events is empty and doubles as the "no events" result.
         if input.events.events:
             return input.events
 
         # Otherwise query from database
         if not input.session_id or not input.transcript_path:
-            return EventsInfo()
+            return input.events
 
         db_path = self._get_db_path(input.transcript_path)
         if not db_path.exists():
-            return EventsInfo()
+            return input.events
 
         events = self._query_events(db_path, input.session_id, limit=250)
         return EventsInfo(events=events)
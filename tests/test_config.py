@@ -1,18 +1,21 @@
 """Unit tests for statusline config."""
 
-import tempfile
 from pathlib import Path
 
+import pytest
 from statusline.config import (
     Config,
     ContextConfig,
     EventsConfig,
     ModelConfig,
     RowLayout,
+    _deep_merge,
     generate_default_config_toml,
     load_config,
+    load_config_from_string,
     normalize_enabled,
 )
+from statusline.errors import StatuslineError
 
 
 class TestModuleConfig:
@@ -189,29 +192,84 @@ class TestLoadConfig:
         assert model_config.label != ""  # Nerd theme has icon label
 
     def test_user_config_overrides_defaults(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write("""
+        config = load_config_from_string("""
 theme = "ascii"
 color = false
 """)
-            f.flush()
-            config = load_config(Path(f.name))
-            assert config.theme == "ascii"
-            assert config.color is False
-            # Defaults should still be loaded for module configs
-            assert "model" in config.modules
+        assert config.theme == "ascii"
+        assert config.color is False
+        # Defaults should still be loaded for module configs
+        assert "model" in config.modules
+
+    def test_user_config_file_overrides_defaults(self, tmp_path):
+        path = tmp_path / "statusline.toml"
+        path.write_text('theme = "ascii"\n')
+        config = load_config(path)
+        assert config.theme == "ascii"
+        assert "model" in config.modules
+
+    def test_identical_theme_overrides_are_shared(self):
+        config = load_config(Path("/nonexistent/path/config.toml"))
+        workspace = config.get_module_config("workspace")
+        cost = config.get_module_config("cost")
+        assert workspace is not None and cost is not None
+        assert workspace.themes["minimal"] == {"label": ""}
+        assert workspace.themes["minimal"] is cost.themes["minimal"]
 
     def test_invalid_toml_raises_error(self):
-        from statusline.errors import StatuslineError
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write("this is not valid toml [[[")
-            f.flush()
-            try:
-                load_config(Path(f.name))
-                assert False, "Expected StatuslineError"
-            except StatuslineError:
-                pass  # Expected
+        try:
+            load_config_from_string("this is not valid toml [[[")
+            assert False, "Expected StatuslineError"
+        except StatuslineError:
+            pass  # Expected
+
+    def test_invalid_toml_file_raises_error(self, tmp_path):
+        path = tmp_path / "statusline.toml"
+        path.write_text("this is not valid toml [[[")
+        try:
+            load_config(path)
+            assert False, "Expected StatuslineError"
+        except StatuslineError:
+            pass  # Expected
+
+
+class TestDeepMerge:
+    def test_override_takes_precedence(self):
+        base = {"a": 1, "nested": {"x": 1, "y": 2}}
+        merged = _deep_merge(base, {"nested": {"y": 3}})
+        assert merged == {"a": 1, "nested": {"x": 1, "y": 3}}
+        assert base == {"a": 1, "nested": {"x": 1, "y": 2}}
+
+    def test_untouched_subtrees_are_shared(self):
+        base = {"theme": "nerd", "modules": {"model": {"color": "cyan"}}}
+        merged = _deep_merge(base, {"theme": "ascii"})
+        assert merged["modules"] is base["modules"]
+
+    def test_empty_override_returns_base(self):
+        base = {"a": 1}
+        assert _deep_merge(base, {}) is base
+
+
+class TestThemeOverride:
+    def test_matches_theme_from_config_file(self):
+        """An explicit theme gives the same modules as setting it in TOML."""
+        config = load_config(Path("/nonexistent/path/config.toml"), theme="ascii")
+        expected = load_config_from_string('theme = "ascii"')
+        assert config.theme == "ascii"
+        assert config.modules == expected.modules
+
+    def test_applies_to_modules_with_their_own_theme(self, tmp_path):
+        path = tmp_path / "statusline.toml"
+        path.write_text('[modules.model]\ntheme = "emoji"\n')
+        assert load_config(path).modules["model"].theme == "emoji"
+        assert load_config(path, theme="ascii").modules["model"].theme == "ascii"
+
+
+class TestModuleValidation:
+    def test_invalid_module_reported_at_load(self):
+        """Modules are validated at load time, even when not enabled."""
+        with pytest.raises(StatuslineError):
+            load_config_from_string('[modules.bogus]\ntype = "nope"\n')
 
 
 class TestNormalizeEnabled:
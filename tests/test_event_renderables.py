@@ -1,19 +1,27 @@
 """Tests for event renderables."""
 
+import sys
+
 import pytest
 from rich.console import Console
 from rich.text import Text
 
-from statusline.config import EventsBackgrounds, EventsLineBars
+from statusline.config import EventsBackgrounds, EventsLineBars, load_config_from_string
 from statusline.modules.events.event import (
+    _KNOWN_NAMES,
+    _TOOL_EVENTS,
+    _TOOL_USE_EVENTS,
     BashEvent,
     EditEvent,
     EventData,
     EventStyle,
     IconEvent,
     InterruptEvent,
+    _bash_command,
     _lines_to_bar,
     create_event,
+    icon_text,
+    render_many,
 )
 
 
@@ -51,9 +59,14 @@ def style() -> EventStyle:
     )
 
 
-def render_to_text(renderable) -> str:
+@pytest.fixture(scope="session")
+def console() -> Console:
+    """Shared Console; each render_to_text call captures separately."""
+    return Console(force_terminal=True, width=80)
+
+
+def render_to_text(renderable, console: Console) -> str:
     """Render a Rich renderable to plain text."""
-    console = Console(force_terminal=True, width=80)
     with console.capture() as capture:
         console.print(renderable, end="")
     return capture.get()
@@ -73,74 +86,191 @@ class TestEventData:
         assert data.tool == "Read"
         assert data.event == "PostToolUse"
 
+    def test_is_immutable(self):
+        data = EventData(event="Stop")
+        with pytest.raises(AttributeError):
+            data.event = "Other"  # type: ignore[misc]
+
+    def test_known_names_are_interned(self):
+        # Build the strings at runtime so they start out as distinct objects
+        event = "".join(["Post", "ToolUse"])
+        tool = "".join(["Re", "ad"])
+        data = EventData(event=event, tool=tool)
+        assert data.event is sys.intern("PostToolUse")
+        assert data.tool is sys.intern("Read")
+        assert data.effective_event is sys.intern("PostToolUse")
+
+    def test_known_names_cover_defaults_and_dispatch(self):
+        """_KNOWN_NAMES must track the default icon keys and dispatched names."""
+        events = load_config_from_string("").get_module_config("events")
+        icon_maps = [events.tool_icons, events.event_icons]
+        for overrides in events.themes.values():
+            icon_maps += [overrides.get("tool_icons", {}), overrides.get("event_icons", {})]
+        # Namespaced keys like "TaskUpdate:completed" name the base tool
+        names = {key.partition(":")[0] for icons in icon_maps for key in icons}
+        names |= _TOOL_EVENTS.keys() | (_TOOL_USE_EVENTS - {""})
+        names |= {"PostToolUseFailure"}  # dispatched on by create_event
+        assert names <= _KNOWN_NAMES, sorted(names - _KNOWN_NAMES)
+
+
+class TestEventStyle:
+    def test_icon_map_namespaces_all_icons(self, style):
+        assert style.icon_map["tool", "Read"] == "[cyan]R[/]\u00a0"
+        assert style.icon_map["tool", "TaskUpdate:completed"] == "[green]✓[/]\u00a0"
+        assert style.icon_map["event", "Stop"] == "[green]S[/]\u00a0"
+        assert style.icon_map["bash", "git"] == "[#f05032]G[/]\u00a0"
+
+    def test_styles_from_same_inputs_are_equal(self, style):
+        other = EventStyle(
+            tool_icons=dict(style.tool_icons),
+            event_icons=dict(style.event_icons),
+            bash_icons=dict(style.bash_icons),
+            backgrounds=style.backgrounds,
+            line_bars=style.line_bars,
+        )
+        assert other == style
+        assert other.icon_map is not style.icon_map
+
+    def test_is_frozen(self, style):
+        with pytest.raises(AttributeError):
+            style.tool_icons = {}  # type: ignore[misc]
+
+    def test_icon_dicts_are_read_only(self, style):
+        with pytest.raises(TypeError):
+            style.tool_icons["Read"] = "X"  # type: ignore[index]
+        assert style.bash_icons["git"] == "[#f05032]G[/]\u00a0"
+
+    def test_task_update_icons_fall_back_to_task_icon(self):
+        style = EventStyle(
+            tool_icons={"TaskUpdate": "T"},
+            event_icons={},
+            bash_icons={},
+            backgrounds=EventsBackgrounds(
+                main="", user="", subagent="", edit_bar=""
+            ),
+            line_bars=EventsLineBars(chars="x", thresholds=[1]),
+        )
+        assert style.task_status_icons == {"completed": "T"}
+        assert style.task_other_icon == "T"
+        assert style.bash_fallback_icon == "•"
+
+    def test_line_bar_matches_lines_to_bar(self, style):
+        chars = style.line_bars.chars
+        thresholds = style.line_bars.thresholds
+        assert len(style.bar_lut) == 202
+        for count in (-1, 0, 1, 5, 6, 63, 64, 201, 202, 10**9):
+            assert style.line_bar(count) == _lines_to_bar(count, chars, thresholds)
+
+    def test_bar_lut_is_capped_for_large_thresholds(self):
+        thresholds = [1, 10, 10**6]
+        style = EventStyle(
+            tool_icons={},
+            event_icons={},
+            bash_icons={},
+            backgrounds=EventsBackgrounds(main="", user="", subagent="", edit_bar=""),
+            line_bars=EventsLineBars(chars="abc", thresholds=thresholds),
+        )
+        assert len(style.bar_lut) == 256
+        for count in (255, 256, 10**6 - 1, 10**6):
+            assert style.line_bar(count) == _lines_to_bar(count, "abc", thresholds)
+
+    def test_bar_lut_is_shared_between_styles(self, style):
+        other = EventStyle(
+            tool_icons={},
+            event_icons={},
+            bash_icons={},
+            backgrounds=style.backgrounds,
+            line_bars=style.line_bars.model_copy(),
+        )
+        assert other.bar_lut is style.bar_lut
+
+
+class TestIconText:
+    def test_parses_markup(self):
+        text = icon_text("[green]S[/]\u00a0")
+        assert text.plain == "S\u00a0"
+        assert text.spans[0].style == "green"
+
+    def test_returns_independent_copies(self):
+        first = icon_text("[green]S[/]")
+        first.append("x")
+        assert icon_text("[green]S[/]").plain == "S"
+
 
 class TestIconEvent:
-    def test_tool_icon(self, style):
+    def test_tool_icon(self, style, console):
         data = EventData(event="PostToolUse", tool="Read")
         event = IconEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "R" in output
 
-    def test_event_icon(self, style):
+    def test_event_icon(self, style, console):
         data = EventData(event="Stop")
         event = IconEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "S" in output
 
-    def test_task_update_completed(self, style):
+    def test_task_update_completed(self, style, console):
         data = EventData(event="PostToolUse", tool="TaskUpdate", extra="status=completed")
         event = IconEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "✓" in output
 
-    def test_task_update_other(self, style):
+    def test_task_update_other(self, style, console):
         data = EventData(event="PostToolUse", tool="TaskUpdate", extra="status=in_progress")
         event = IconEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "~" in output
 
 
 class TestBashEvent:
-    def test_command_specific_icon(self, style):
+    def test_command_specific_icon(self, style, console):
         data = EventData(event="PostToolUse", tool="Bash", extra="git status")
         event = BashEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "G" in output  # git icon
 
-    def test_command_with_path(self, style):
+    def test_command_with_path(self, style, console):
         data = EventData(event="PostToolUse", tool="Bash", extra="/usr/bin/git status")
         event = BashEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "G" in output  # git icon (path stripped)
 
-    def test_unknown_command_fallback(self, style):
+    def test_unknown_command_fallback(self, style, console):
         data = EventData(event="PostToolUse", tool="Bash", extra="some_unknown_cmd")
         event = BashEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "B" in output  # generic Bash icon
 
 
 class TestEditEvent:
-    def test_edit_with_line_bars(self, style):
+    def test_edit_with_line_bars(self, style, console):
         data = EventData(event="PostToolUse", tool="Edit", extra="+10-5")
         event = EditEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "E" in output  # Edit icon
         # Should have bar characters
         assert "▃" in output or "▄" in output  # line bar chars
 
-    def test_edit_no_extra(self, style):
+    def test_edit_no_extra(self, style, console):
         data = EventData(event="PostToolUse", tool="Edit")
         event = EditEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "E" in output
 
+    def test_renders_independent_texts(self, style):
+        data = EventData(event="PostToolUse", tool="Edit", extra="+10-5")
+        first = EditEvent(data, style).__rich__()
+        first.append("x")
+        second = EditEvent(data, style).__rich__()
+        assert second.plain == first.plain[:-1]
+
 
 class TestInterruptEvent:
-    def test_interrupt_icon(self, style):
+    def test_interrupt_icon(self, style, console):
         data = EventData(event="PostToolUseFailure", extra="interrupt")
         event = InterruptEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "!" in output
 
 
@@ -171,6 +301,24 @@ class TestCreateEvent:
         assert isinstance(event, IconEvent)
 
 
+class TestRenderMany:
+    def test_joins_events_with_spacing(self, style):
+        events = [EventData(event="PostToolUse", tool="Read"), EventData(event="Stop")]
+        text = render_many(events, style, spacing=2)
+        assert text.plain == "R\u00a0  S\u00a0"
+
+    def test_preserves_event_styles(self, style):
+        events = [EventData(event="PostToolUse", tool="Read"), EventData(event="Stop")]
+        text = render_many(events, style, spacing=1)
+        assert [(s.start, s.end, str(s.style)) for s in text.spans] == [
+            (0, 1, "cyan"),
+            (3, 4, "green"),
+        ]
+
+    def test_empty(self, style):
+        assert render_many([], style).plain == ""
+
+
 # =============================================================================
 # Edge Case Tests
 # =============================================================================
@@ -189,7 +337,7 @@ class TestEventDataEdgeCases:
     def test_empty_effective_event_defaults_to_event(self):
         """Explicitly passing empty string for effective_event should default to event."""
         data = EventData(event="Stop", effective_event="")
-        # model_post_init sets effective_event to event when empty
+        # An empty effective_event falls back to event
         assert data.effective_event == "Stop"
 
     def test_none_optional_fields(self):
@@ -339,11 +487,24 @@ class TestEditEventParsingEdgeCases:
         assert added == 10
         assert removed == 5
 
-    def test_edit_renders_with_malformed_extra(self, style):
+    def test_parse_underscore_separated_digits(self, style):
+        """'+1_0-2' parses like int('1_0'); doubled underscores don't."""
+        data = EventData(event="PostToolUse", tool="Edit", extra="+1_0-2")
+        assert EditEvent(data, style)._parse_line_counts() == (10, 2)
+        data = EventData(event="PostToolUse", tool="Edit", extra="+1__0-2")
+        assert EditEvent(data, style)._parse_line_counts() == (None, None)
+
+    def test_parse_whitespace_only_count(self, style):
+        """A count of only whitespace is invalid, as int(' ') is."""
+        data = EventData(event="PostToolUse", tool="Edit", extra="+ -5")
+        event = EditEvent(data, style)
+        assert event._parse_line_counts() == (None, None)
+
+    def test_edit_renders_with_malformed_extra(self, style, console):
         """EditEvent should still render icon even with malformed extra."""
         data = EventData(event="PostToolUse", tool="Edit", extra="garbage")
         event = EditEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         # Should have Edit icon, no bars
         assert "E" in output
         # Should NOT have bar characters (only icon)
@@ -353,80 +514,87 @@ class TestEditEventParsingEdgeCases:
 class TestBashEventEdgeCases:
     """Edge cases for BashEvent command parsing."""
 
-    def test_empty_extra(self, style):
+    def test_empty_extra(self, style, console):
         """Empty extra string should fall back to generic Bash icon."""
         data = EventData(event="PostToolUse", tool="Bash", extra="")
         event = BashEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "B" in output
 
-    def test_none_extra(self, style):
+    def test_none_extra(self, style, console):
         """None extra should fall back to generic Bash icon."""
         data = EventData(event="PostToolUse", tool="Bash", extra=None)
         event = BashEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "B" in output
 
-    def test_whitespace_only_extra(self, style):
+    def test_whitespace_only_extra(self, style, console):
         """Whitespace-only extra should fall back to generic Bash icon."""
         data = EventData(event="PostToolUse", tool="Bash", extra="   ")
         event = BashEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         # split() on whitespace gives [], so falls back
         assert "B" in output
 
-    def test_only_path_separators(self, style):
+    def test_only_path_separators(self, style, console):
         """Extra with only path separators like '///' should get empty cmd."""
         data = EventData(event="PostToolUse", tool="Bash", extra="///")
         event = BashEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         # cmd = ''.split('/')[-1] = '', not in bash_icons, falls back
         assert "B" in output
 
-    def test_command_with_leading_spaces(self, style):
+    def test_command_with_leading_spaces(self, style, console):
         """Extra with leading spaces should still parse command."""
         data = EventData(event="PostToolUse", tool="Bash", extra="  git status")
         event = BashEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         # split() handles leading whitespace
         assert "G" in output
 
-    def test_command_only_no_args(self, style):
+    def test_command_only_no_args(self, style, console):
         """Single command with no arguments."""
         data = EventData(event="PostToolUse", tool="Bash", extra="pytest")
         event = BashEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "P" in output
 
-    def test_very_long_command(self, style):
+    def test_very_long_command(self, style, console):
         """Very long command string should not crash."""
         long_cmd = "git " + "a" * 10000
         data = EventData(event="PostToolUse", tool="Bash", extra=long_cmd)
         event = BashEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "G" in output
 
+    def test_bash_command_parsing(self):
+        """Command name is the first word with its path prefix stripped."""
+        assert _bash_command("git status") == "git"
+        assert _bash_command("  /usr/bin/git status") == "git"
+        assert _bash_command("   ") == ""
+        assert _bash_command("///") == ""
+
 
 class TestIconFallbacks:
     """Tests for icon fallback behavior when icons are missing."""
 
-    def test_missing_tool_icon_fallback(self, style):
+    def test_missing_tool_icon_fallback(self, style, console):
         """Unknown tool should fall back to bullet character."""
         data = EventData(event="PostToolUse", tool="UnknownTool")
         event = IconEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         # Default fallback is bullet
         assert "\u2022" in output  # Unicode bullet
 
-    def test_missing_event_icon_returns_empty(self, style):
+    def test_missing_event_icon_returns_empty(self, style, console):
         """Unknown event should return empty string (no output)."""
         data = EventData(event="UnknownEvent")
         event = IconEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         # No icon configured, _get_icon returns '', no output
         assert output == ""
 
-    def test_missing_bash_icon_fallback(self):
+    def test_missing_bash_icon_fallback(self, console):
         """Unknown bash command should fall back to generic Bash icon."""
         # Create style with no Bash icon to test ultimate fallback
         style_no_bash = EventStyle(
@@ -440,11 +608,11 @@ class TestIconFallbacks:
         )
         data = EventData(event="PostToolUse", tool="Bash", extra="unknown_cmd")
         event = BashEvent(data, style_no_bash)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         # Falls back to tool_icons.get("Bash", bullet) -> bullet
         assert "\u2022" in output
 
-    def test_missing_interrupt_icon_no_output(self):
+    def test_missing_interrupt_icon_no_output(self, console):
         """Missing Interrupt icon should yield nothing."""
         style_no_interrupt = EventStyle(
             tool_icons={},
@@ -457,11 +625,11 @@ class TestIconFallbacks:
         )
         data = EventData(event="PostToolUseFailure", extra="interrupt")
         event = InterruptEvent(data, style_no_interrupt)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         # No icon, yields nothing
         assert output == ""
 
-    def test_missing_edit_icon_fallback(self):
+    def test_missing_edit_icon_fallback(self, console):
         """Missing Edit icon should use default pencil."""
         style_no_edit = EventStyle(
             tool_icons={},  # No Edit icon
@@ -474,7 +642,7 @@ class TestIconFallbacks:
         )
         data = EventData(event="PostToolUse", tool="Edit", extra="+5-3")
         event = EditEvent(data, style_no_edit)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         # Falls back to default pencil
         assert "\u270f" in output  # Pencil character
 
@@ -537,46 +705,46 @@ class TestLinesToBarEdgeCases:
 class TestTaskUpdateEdgeCases:
     """Edge cases for TaskUpdate icon selection."""
 
-    def test_task_update_no_extra(self, style):
+    def test_task_update_no_extra(self, style, console):
         """TaskUpdate with no extra should use generic TaskUpdate icon."""
         data = EventData(event="PostToolUse", tool="TaskUpdate", extra=None)
         event = IconEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         # No "status=" prefix, so gets generic TaskUpdate icon
         assert "T" in output
 
-    def test_task_update_empty_extra(self, style):
+    def test_task_update_empty_extra(self, style, console):
         """TaskUpdate with empty extra should use generic icon."""
         data = EventData(event="PostToolUse", tool="TaskUpdate", extra="")
         event = IconEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "T" in output
 
-    def test_task_update_status_prefix_no_value(self, style):
+    def test_task_update_status_prefix_no_value(self, style, console):
         """TaskUpdate with 'status=' but no value should use 'other' icon."""
         data = EventData(event="PostToolUse", tool="TaskUpdate", extra="status=")
         event = IconEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         # status = '' (empty), not 'completed', so 'other'
         assert "~" in output
 
-    def test_task_update_status_unknown(self, style):
+    def test_task_update_status_unknown(self, style, console):
         """TaskUpdate with unknown status should use 'other' icon."""
         data = EventData(event="PostToolUse", tool="TaskUpdate", extra="status=unknown_status")
         event = IconEvent(data, style)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "~" in output
 
 
 class TestCreateEventEdgeCases:
     """Edge cases for the create_event factory function."""
 
-    def test_tool_with_empty_event(self, style):
+    def test_tool_with_empty_event(self, style, console):
         """Tool with empty event string should be treated as tool event."""
         data = EventData(event="", tool="Read")
         event = create_event(data, style)
         assert isinstance(event, IconEvent)
-        output = render_to_text(event)
+        output = render_to_text(event, console)
         assert "R" in output
 
     def test_post_tool_use_failure_not_interrupt(self, style):